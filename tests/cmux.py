@@ -33,11 +33,16 @@ import select
 import os
 import time
 import errno
+import itertools
 import json
 import base64
-import glob
 import re
-from typing import Optional, List, Tuple, Union
+import threading
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, Optional, List, Tuple, Union
+
+if TYPE_CHECKING:
+    # Imported lazily in _rng(); only needed here for annotations.
+    import random
 
 
 class cmuxError(Exception):
@@ -48,21 +53,131 @@ class cmuxError(Exception):
 _LAST_SOCKET_PATH_FILE = "/tmp/cmux-last-socket-path"
 _DEFAULT_DEBUG_BUNDLE_ID = "com.cmuxterm.app.debug"
 
+_RECV_CHUNK_SIZE = 65536
+_SOCKET_BUFFER_SIZE = 1 << 20
+
+# Precomposed payloads for fixed, frequently polled commands.
+_CMD_PING = b"ping\n"
+_CMD_CURRENT_TAB = b"current_tab\n"
+_CMD_RESET_FLASH = b"reset_flash_counts\n"
+
+_SLUG_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+_SLUG_DASHES = re.compile(r"-+")
+_BUNDLE_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+_BUNDLE_DOTS = re.compile(r"\.+")
+# `index:id|tab|surface|read|title|subtitle|body` (body may contain `|`).
+_NOTIF_RE = re.compile(r"^[^:]+:([^|]*)\|([^|]*)\|([^|]*)\|([^|]*)\|([^|]*)\|([^|]*)\|(.*)$")
+
+# Live resolved paths keyed by the env vars that influence resolution. Entries
+# are reused while the last-socket-path file is unchanged, the path still
+# exists, and the entry is younger than _PATH_CACHE_TTL seconds.
+_PATH_CACHE: Dict[tuple, Tuple[str, Optional[float], float]] = {}
+_PATH_CACHE_TTL = 10.0
+_BUNDLE_ID_CACHE: Dict[tuple, str] = {}
+
+_RNG: Optional["random.Random"] = None
+_RNG_PID: Optional[int] = None
+
+
+def _rng() -> "random.Random":
+    # Seeded lazily (and re-seeded after fork) so concurrent test processes
+    # don't share a jitter sequence and retry in lockstep.
+    global _RNG, _RNG_PID
+    pid = os.getpid()
+    if _RNG is None or _RNG_PID != pid:
+        import random
+
+        _RNG = random.Random()
+        _RNG_PID = pid
+    return _RNG
+
+
+def _backoff_iter(
+    initial: float = 0.02,
+    factor: float = 2.0,
+    cap: float = 0.5,
+    jitter: float = 0.5,
+    deadline: float = 2.0,
+):
+    """Yield jittered exponential backoff sleeps until `deadline` seconds have elapsed."""
+    rng = _rng()
+    end = time.monotonic() + deadline
+    base = initial
+    while True:
+        remaining = end - time.monotonic()
+        if remaining <= 0:
+            return
+        delay = min(cap, base) * rng.uniform(1 - jitter, 1 + jitter)
+        yield min(delay, remaining)
+        base = min(cap, base * factor)
+
 
 def _sanitize_tag_slug(raw: str) -> str:
-    cleaned = re.sub(r"[^a-z0-9]+", "-", (raw or "").strip().lower())
-    cleaned = re.sub(r"-+", "-", cleaned).strip("-")
+    cleaned = _SLUG_NON_ALNUM.sub("-", (raw or "").strip().lower())
+    cleaned = _SLUG_DASHES.sub("-", cleaned).strip("-")
     return cleaned or "agent"
 
 
 def _sanitize_bundle_suffix(raw: str) -> str:
     # Must match scripts/reload.sh sanitize_bundle() so tagged tests can
     # reliably target the correct app via AppleScript.
-    cleaned = re.sub(r"[^a-z0-9]+", ".", (raw or "").strip().lower())
-    cleaned = re.sub(r"\.+", ".", cleaned).strip(".")
+    cleaned = _BUNDLE_NON_ALNUM.sub(".", (raw or "").strip().lower())
+    cleaned = _BUNDLE_DOTS.sub(".", cleaned).strip(".")
     return cleaned or "agent"
 
 
+_SEND_ESCAPE = str.maketrans({"\n": "\\n", "\r": "\\r", "\t": "\\t"})
+
+
+def _escape_send_text(text: str) -> str:
+    # Escape actual newlines/tabs to their backslash forms for protocol.
+    # The server will unescape them. Clean text (the common case) is
+    # returned as-is without a copy.
+    if "\n" in text or "\r" in text or "\t" in text:
+        return text.translate(_SEND_ESCAPE)
+    return text
+
+
+def _parse_ok(response: str, *, has_payload: bool = False) -> str:
+    """Return the payload after `OK ` (or "" for a bare OK); raise cmuxError otherwise."""
+    if has_payload:
+        if response.startswith("OK "):
+            return response[3:]
+    elif response == "OK" or response.startswith("OK "):
+        return ""
+    raise cmuxError(response)
+
+
+def _parse_workspace_rows(response: str) -> List[Tuple[int, str, str, bool]]:
+    # Rows look like `<*| > <index>: <id> <title>`. Slice around the colon
+    # rather than lstrip/split so each row costs a couple of C-level scans.
+    rows = []
+    for line in response.split("\n"):
+        selected = line[:1] == "*"
+        start = 1 if selected else 0
+        idx_end = line.find(":", start)
+        if idx_end < 0:
+            continue
+        row_id, sep, title = line[idx_end + 2:].partition(" ")
+        if not sep:
+            continue
+        # int() tolerates the padding space before the index.
+        rows.append((int(line[start:idx_end]), row_id, title, selected))
+    return rows
+
+
+def _format_notify(prefix: str, title: str, subtitle: str, body: str) -> str:
+    # Build the whole command in one f-string so large bodies are copied once.
+    if subtitle or body:
+        return f"{prefix} {title}|{subtitle}|{body}"
+    return f"{prefix} {title}"
+
+
+def _with_tab(parts: List[str], tab: Optional[str]) -> None:
+    if tab:
+        parts.append(f"--tab={tab}")
+
+
 def _quote_option_value(value: str) -> str:
     # Must match TerminalController.parseOptions() quoting rules.
     escaped = (value or "").replace("\\", "\\\\").replace('"', '\\"')
@@ -71,15 +186,22 @@ def _quote_option_value(value: str) -> str:
 
 def _default_bundle_id() -> str:
     override = os.environ.get("CMUX_BUNDLE_ID")
-    if override:
-        return override
-
     tag = os.environ.get("CMUX_TAG")
-    if tag:
+    key = (tag, override)
+    cached = _BUNDLE_ID_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    if override:
+        bundle_id = override
+    elif tag:
         suffix = _sanitize_bundle_suffix(tag)
-        return f"{_DEFAULT_DEBUG_BUNDLE_ID}.{suffix}"
+        bundle_id = f"{_DEFAULT_DEBUG_BUNDLE_ID}.{suffix}"
+    else:
+        bundle_id = _DEFAULT_DEBUG_BUNDLE_ID
 
-    return _DEFAULT_DEBUG_BUNDLE_ID
+    _BUNDLE_ID_CACHE[key] = bundle_id
+    return bundle_id
 
 
 def _read_last_socket_path() -> Optional[str]:
@@ -93,25 +215,110 @@ def _read_last_socket_path() -> Optional[str]:
     return None
 
 
-def _can_connect(path: str, timeout: float = 0.15, retries: int = 4) -> bool:
-    # Best-effort check to avoid getting stuck on stale socket files.
-    for _ in range(max(1, retries)):
+def _first_connectable(paths: Iterable[Optional[str]]) -> Optional[str]:
+    """Return the first of `paths` (in priority order) with a live listener."""
+    # Best-effort check to avoid getting stuck on stale socket files. Unix
+    # socket connects complete (or fail) synchronously, so a non-blocking
+    # connect_ex answers immediately and a stale path costs no timeout. Stop at
+    # the first live path so lower-priority instances are never connected to.
+    # `paths` may be lazy; only pull (and dedupe) as far as the first hit.
+    seen = set()
+    for path in paths:
+        if not path or path in seen:
+            continue
+        seen.add(path)
+        if not os.path.exists(path):
+            continue
         s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
         try:
-            s.settimeout(timeout)
-            s.connect(path)
-            return True
-        except OSError:
-            time.sleep(0.05)
+            s.setblocking(False)
+            err = s.connect_ex(path)
         finally:
-            try:
-                s.close()
-            except Exception:
-                pass
-    return False
+            s.close()
+        # EAGAIN: a live listener whose backlog is full. The socket never got
+        # connected, but the blocking connect in cmux.connect() will wait it out.
+        if err in (0, errno.EAGAIN, errno.EWOULDBLOCK):
+            return path
+    return None
+
+
+def _tune_socket(sock: socket.socket) -> None:
+    # Larger buffers let back-to-back replies land without extra wakeups. The
+    # kernel may clamp or reject these; that's fine.
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, _SOCKET_BUFFER_SIZE)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _SOCKET_BUFFER_SIZE)
+    except OSError:
+        pass
+
+    # Opt-in busy polling (Linux only) for latency-sensitive harnesses.
+    busy_poll = os.environ.get("CMUX_BUSY_POLL_US")
+    if busy_poll and hasattr(socket, "SO_BUSY_POLL"):
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_BUSY_POLL, int(busy_poll))
+        except (OSError, ValueError):
+            pass
+
+
+def _last_socket_path_mtime() -> Optional[float]:
+    try:
+        return os.stat(_LAST_SOCKET_PATH_FILE).st_mtime
+    except OSError:
+        return None
+
+
+def _tagged_debug_sockets() -> List[str]:
+    """Return /tmp/cmux-debug-*.sock paths, newest first."""
+    # One directory scan; each match costs a single stat for its mtime.
+    entries = []
+    try:
+        with os.scandir("/tmp") as it:
+            for entry in it:
+                name = entry.name
+                if not (name.startswith("cmux-debug-") and name.endswith(".sock")):
+                    continue
+                try:
+                    entries.append((entry.stat().st_mtime, entry.path))
+                except OSError:
+                    # Removed between readdir and stat.
+                    continue
+    except OSError:
+        return []
+    entries.sort(reverse=True)
+    return [path for _, path in entries]
+
+
+def _iter_tagged_debug_sockets() -> Iterator[str]:
+    # Generator so the directory scan is deferred until first iteration.
+    yield from _tagged_debug_sockets()
 
 
 def _default_socket_path() -> str:
+    key = (
+        os.environ.get("CMUX_TAG"),
+        os.environ.get("CMUX_SOCKET_PATH"),
+        os.environ.get("CMUX_BUNDLE_ID"),
+    )
+    mtime = _last_socket_path_mtime()
+    now = time.monotonic()
+    cached = _PATH_CACHE.get(key)
+    if cached is not None:
+        path, cached_mtime, stored_at = cached
+        if cached_mtime == mtime and now - stored_at < _PATH_CACHE_TTL and os.path.exists(path):
+            return path
+
+    path, live = _resolve_socket_path()
+    # Only cache paths that accepted a connection. Fallback guesses are
+    # re-resolved every time so a listener that comes up later is found.
+    if live:
+        _PATH_CACHE[key] = (path, mtime, now)
+    else:
+        _PATH_CACHE.pop(key, None)
+    return path
+
+
+def _resolve_socket_path() -> Tuple[str, bool]:
+    """Return (path, live), where live means the path accepted a connection."""
     tag = os.environ.get("CMUX_TAG")
     if tag:
         slug = _sanitize_tag_slug(tag)
@@ -119,54 +326,91 @@ def _default_socket_path() -> str:
             f"/tmp/cmux-debug-{slug}.sock",
             f"/tmp/cmux-{slug}.sock",
         ]
-        for path in tagged_candidates:
-            if os.path.exists(path) and _can_connect(path):
-                return path
+        live = _first_connectable(tagged_candidates)
+        if live:
+            return live, True
         # If nothing is connectable yet (e.g. the app is still starting),
         # fall back to the first existing candidate.
         for path in tagged_candidates:
             if os.path.exists(path):
-                return path
+                return path, False
         # Prefer the debug naming convention when we have to guess.
-        return tagged_candidates[0]
+        return tagged_candidates[0], False
 
     override = os.environ.get("CMUX_SOCKET_PATH")
-    if override:
-        if os.path.exists(override) and _can_connect(override):
-            return override
-        # Fall back to other heuristics if the override points at a stale socket file.
-        if not os.path.exists(override):
-            return override
-
-    last_socket = _read_last_socket_path()
-    if last_socket:
-        if os.path.exists(last_socket) and _can_connect(last_socket):
-            return last_socket
-
-    # Prefer the non-tagged sockets when present.
+    if override and not os.path.exists(override):
+        return override, False
+
+    # Candidates in priority order: the override (when it points at a socket
+    # file that may be stale), the last socket the app reported, the
+    # non-tagged sockets, then the newest tagged debug sockets. The /tmp scan
+    # for tagged sockets only runs if everything before it is stale.
     candidates = ["/tmp/cmux-debug.sock", "/tmp/cmux.sock"]
-    for path in candidates:
-        if os.path.exists(path) and _can_connect(path):
-            return path
+    probe = itertools.chain(
+        [override, _read_last_socket_path(), *candidates],
+        _iter_tagged_debug_sockets(),
+    )
+
+    live = _first_connectable(probe)
+    if live:
+        return live, True
 
-    # Otherwise, fall back to the newest tagged debug socket if there is one.
-    tagged = glob.glob("/tmp/cmux-debug-*.sock")
-    tagged = [p for p in tagged if os.path.exists(p)]
-    if tagged:
-        tagged.sort(key=lambda p: os.path.getmtime(p), reverse=True)
-        for p in tagged:
-            if _can_connect(p, timeout=0.1, retries=2):
-                return p
+    return candidates[0], False
 
-    return candidates[0]
+
+# Process-wide clients from cmux.shared(), keyed by the requested socket path
+# (None = default resolution). Cleared after fork().
+_SHARED_CLIENTS: Dict[Optional[str], "cmux"] = {}
+_SHARED_CLIENTS_PID: Optional[int] = None
+_SHARED_CLIENTS_LOCK = threading.Lock()
 
 
 class cmux:
     """Client for controlling cmux via Unix socket"""
 
+    # Fixed attribute layout: no per-instance __dict__, and a typo'd attribute
+    # assignment fails loudly instead of silently creating a new field.
+    __slots__ = (
+        "socket_path",
+        "_socket",
+        "_recv_buffer",
+        "_shared",
+        "_lock",
+        "_recv_scratch",
+        "_recv_view",
+        "_poll",
+    )
+
     DEFAULT_SOCKET_PATH = _default_socket_path()
     DEFAULT_BUNDLE_ID = _default_bundle_id()
 
+    @classmethod
+    def shared(cls, socket_path: str = None) -> "cmux":
+        """
+        Return a connected, process-wide client for `socket_path` (default:
+        auto-detect). `with cmux.shared() as client:` leaves the connection
+        open on exit so later callers reuse it; call close() to tear it down
+        explicitly. A client whose connection dropped is reconnected on the next
+        call, and commands from multiple threads are serialized.
+        """
+        global _SHARED_CLIENTS_PID
+        with _SHARED_CLIENTS_LOCK:
+            pid = os.getpid()
+            # Never reuse a socket inherited across fork().
+            if _SHARED_CLIENTS_PID != pid:
+                _SHARED_CLIENTS.clear()
+                _SHARED_CLIENTS_PID = pid
+            client = _SHARED_CLIENTS.get(socket_path)
+            if client is None:
+                client = cls(socket_path)
+                client._shared = True
+                _SHARED_CLIENTS[socket_path] = client
+            elif client._socket is None and socket_path is None:
+                # The app may have come back on a different socket.
+                client.socket_path = _default_socket_path()
+            client.connect()
+            return client
+
     @staticmethod
     def default_socket_path() -> str:
         return _default_socket_path()
@@ -179,92 +423,215 @@ class cmux:
         # Resolve at init time so imports don't "lock in" a stale path.
         self.socket_path = socket_path or _default_socket_path()
         self._socket: Optional[socket.socket] = None
-        self._recv_buffer: str = ""
+        self._recv_buffer: bytearray = bytearray()
+        self._shared = False
+        # Serializes connect/close and request/response exchanges so threads
+        # sharing a client (e.g. via cmux.shared()) never interleave on the
+        # socket. Re-entrant because _send_raw closes a dead socket while
+        # holding it.
+        self._lock = threading.RLock()
+        # Reused for every recv so large replies don't allocate per chunk.
+        self._recv_scratch = bytearray(_RECV_CHUNK_SIZE)
+        self._recv_view = memoryview(self._recv_scratch)
+        # Registered for POLLIN on the connected (non-blocking) socket.
+        self._poll = None
 
     def connect(self) -> None:
         """Connect to the cmux socket"""
-        if self._socket is not None:
-            return
-
-        start = time.time()
-        while not os.path.exists(self.socket_path):
-            if time.time() - start >= 2.0:
-                raise cmuxError(
-                    f"Socket not found at {self.socket_path}. "
-                    "Is cmux running?"
-                )
-            time.sleep(0.1)
-
-        last_error: Optional[socket.error] = None
-        while True:
-            self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-            try:
-                self._socket.connect(self.socket_path)
-                self._socket.settimeout(5.0)
+        with self._lock:
+            if self._socket is not None:
                 return
-            except socket.error as e:
-                last_error = e
-                self._socket.close()
-                self._socket = None
-                if e.errno in (errno.ECONNREFUSED, errno.ENOENT) and time.time() - start < 2.0:
-                    time.sleep(0.1)
-                    continue
-                raise cmuxError(f"Failed to connect: {e}")
+
+            delays = _backoff_iter()
+            last_error: Optional[socket.error] = None
+            while True:
+                if os.path.exists(self.socket_path):
+                    self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                    try:
+                        self._socket.connect(self.socket_path)
+                        _tune_socket(self._socket)
+                        self._socket.setblocking(False)
+                        self._poll = select.poll()
+                        self._poll.register(self._socket.fileno(), select.POLLIN)
+                        return
+                    except socket.error as e:
+                        self._socket.close()
+                        self._socket = None
+                        if e.errno not in (errno.ECONNREFUSED, errno.ENOENT):
+                            raise cmuxError(f"Failed to connect: {e}")
+                        last_error = e
+
+                delay = next(delays, None)
+                if delay is None:
+                    if last_error is None:
+                        raise cmuxError(
+                            f"Socket not found at {self.socket_path}. "
+                            "Is cmux running?"
+                        )
+                    raise cmuxError(f"Failed to connect: {last_error}")
+                time.sleep(delay)
 
     def close(self) -> None:
         """Close the connection"""
-        if self._socket is not None:
-            self._socket.close()
-            self._socket = None
+        with self._lock:
+            if self._poll is not None:
+                if self._socket is not None:
+                    try:
+                        self._poll.unregister(self._socket.fileno())
+                    except (KeyError, ValueError):
+                        pass
+                self._poll = None
+            if self._socket is not None:
+                self._socket.close()
+                self._socket = None
+            # Unread bytes from this connection are meaningless on the next one.
+            self._recv_buffer = bytearray()
 
     def __enter__(self):
         self.connect()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.close()
+        if not self._shared:
+            self.close()
         return False
 
+    def _sendall(self, payload: bytes, deadline: float) -> None:
+        # The socket is non-blocking, so wait for buffer space if a large
+        # payload doesn't fit in one send().
+        view = memoryview(payload)
+        while view:
+            try:
+                sent = self._socket.send(view)
+            except BlockingIOError:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise cmuxError("Command timed out")
+                # Briefly switch the registered poll over to write readiness.
+                fd = self._socket.fileno()
+                self._poll.modify(fd, select.POLLOUT)
+                try:
+                    self._poll.poll(max(1, int(remaining * 1000)))
+                finally:
+                    self._poll.modify(fd, select.POLLIN)
+                continue
+            view = view[sent:]
+
     def _send_command(self, command: str) -> str:
         """Send a command and receive response"""
-        if self._socket is None:
-            raise cmuxError("Not connected")
+        return self._send_raw((command + "\n").encode())
 
-        try:
-            self._socket.sendall((command + "\n").encode())
-            data = self._recv_buffer
-            self._recv_buffer = ""
-            saw_newline = "\n" in data
-            start = time.time()
-            while True:
-                if saw_newline:
-                    ready, _, _ = select.select([self._socket], [], [], 0.1)
-                    if not ready:
-                        break
-                try:
-                    chunk = self._socket.recv(8192)
-                except socket.timeout:
+    def _send_raw(self, payload: bytes) -> str:
+        """Send an already newline-terminated, encoded command and receive response"""
+        with self._lock:
+            if self._socket is None:
+                raise cmuxError("Not connected")
+
+            try:
+                deadline = time.monotonic() + 5.0
+                self._sendall(payload, deadline)
+                buf = self._recv_buffer
+                self._recv_buffer = bytearray()
+                saw_newline = buf.find(b"\n") >= 0
+                while True:
+                    # Once a newline arrives, keep draining until the socket has
+                    # been quiet for 100ms (replies can span multiple lines).
                     if saw_newline:
+                        timeout_ms = 100
+                    else:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            raise cmuxError("Command timed out")
+                        timeout_ms = max(1, int(remaining * 1000))
+                    if not self._poll.poll(timeout_ms):
+                        if saw_newline:
+                            break
+                        continue
+                    try:
+                        n = self._socket.recv_into(self._recv_view, _RECV_CHUNK_SIZE)
+                    except BlockingIOError:
+                        continue
+                    if not n:
+                        # Server hung up; drop the socket so connect() (and
+                        # cmux.shared()) can reconnect.
+                        self.close()
                         break
-                    if time.time() - start >= 5.0:
+                    buf.extend(self._recv_view[:n])
+                    if not saw_newline and buf.find(b"\n", len(buf) - n) >= 0:
+                        saw_newline = True
+                # Bytes after the final newline belong to a reply that is still
+                # arriving; keep them buffered for the next read.
+                end = buf.rfind(b"\n")
+                if end >= 0 and end + 1 < len(buf):
+                    if self._socket is not None:
+                        self._recv_buffer = buf[end + 1:]
+                    del buf[end + 1:]
+                data = buf.decode("utf-8")
+                return data[:-1] if data.endswith("\n") else data
+            except socket.error as e:
+                self.close()
+                raise cmuxError(f"Socket error: {e}")
+
+    def _send_commands_batch(self, commands: List[str]) -> List[str]:
+        """Pipeline several commands in one write and return their responses in order.
+
+        Responses are delimited by newline count, so every command must produce
+        a single-line reply (OK/ERROR-style commands). Use _send_command for
+        multi-line replies such as list_tabs or sidebar_state.
+        """
+        if not commands:
+            return []
+        for command in commands:
+            # The server skips blank lines without replying, which would
+            # misalign every response after it.
+            if not command.strip() or "\n" in command:
+                raise cmuxError(f"Invalid batch command: {command!r}")
+
+        expected = len(commands)
+        with self._lock:
+            if self._socket is None:
+                raise cmuxError("Not connected")
+
+            try:
+                deadline = time.monotonic() + 5.0
+                self._sendall(("\n".join(commands) + "\n").encode(), deadline)
+                buf = self._recv_buffer
+                self._recv_buffer = bytearray()
+                while buf.count(b"\n") < expected:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
                         raise cmuxError("Command timed out")
-                    continue
-                if not chunk:
-                    break
-                data += chunk.decode()
-                if "\n" in data:
-                    saw_newline = True
-            if data.endswith("\n"):
-                data = data[:-1]
-            return data
-        except socket.timeout:
-            raise cmuxError("Command timed out")
-        except socket.error as e:
-            raise cmuxError(f"Socket error: {e}")
+                    if not self._poll.poll(max(1, int(remaining * 1000))):
+                        continue
+                    try:
+                        n = self._socket.recv_into(self._recv_view, _RECV_CHUNK_SIZE)
+                    except BlockingIOError:
+                        continue
+                    if not n:
+                        self.close()
+                        raise cmuxError("Connection closed before all batch responses arrived")
+                    buf.extend(self._recv_view[:n])
+            except socket.error as e:
+                self.close()
+                raise cmuxError(f"Socket error: {e}")
+
+            end = -1
+            for _ in range(expected):
+                end = buf.find(b"\n", end + 1)
+            self._recv_buffer = buf[end + 1:]
+            del buf[end:]
+            return buf.decode("utf-8").split("\n")
+
+    def batch(self, commands: List[str]) -> List[str]:
+        """
+        Send several single-line-reply commands in one round trip.
+        Returns the raw response for each command, in order.
+        """
+        return self._send_commands_batch(commands)
 
     def ping(self) -> bool:
         """Check if the server is responding"""
-        response = self._send_command("ping")
+        response = self._send_raw(_CMD_PING)
         return response == "PONG"
 
     def list_tabs(self) -> List[Tuple[int, str, str, bool]]:
@@ -278,53 +645,35 @@ class cmux:
         if response in ("No tabs", "No workspaces"):
             return []
 
-        tabs = []
-        for line in response.split("\n"):
-            if not line.strip():
-                continue
-            selected = line.startswith("*")
-            parts = line.lstrip("* ").split(" ", 2)
-            if len(parts) >= 3:
-                index = int(parts[0].rstrip(":"))
-                tab_id = parts[1]
-                title = parts[2] if len(parts) > 2 else ""
-                tabs.append((index, tab_id, title, selected))
-        return tabs
+        return _parse_workspace_rows(response)
 
     def new_tab(self) -> str:
         """Create a new tab. Returns the new tab's ID."""
         response = self._send_command("new_tab")
         if response.startswith("ERROR: Unknown command"):
             response = self._send_command("new_workspace")
-        if response.startswith("OK "):
-            return response[3:]
-        raise cmuxError(response)
+        return _parse_ok(response, has_payload=True)
 
     def new_split(self, direction: str) -> str:
         """Create a split in the given direction (left/right/up/down). Returns new panel ID when available."""
         response = self._send_command(f"new_split {direction}")
-        if response.startswith("OK "):
-            return response[3:]
-        if response.startswith("OK"):
+        if response == "OK":
             return ""
-        if not response.startswith("OK"):
-            raise cmuxError(response)
+        return _parse_ok(response, has_payload=True)
 
     def close_tab(self, tab_id: str) -> None:
         """Close a tab by ID"""
         response = self._send_command(f"close_tab {tab_id}")
         if response.startswith("ERROR: Unknown command"):
             response = self._send_command(f"close_workspace {tab_id}")
-        if not response.startswith("OK"):
-            raise cmuxError(response)
+        _parse_ok(response)
 
     def select_tab(self, tab: Union[str, int]) -> None:
         """Select a tab by ID or index"""
         response = self._send_command(f"select_tab {tab}")
         if response.startswith("ERROR: Unknown command"):
             response = self._send_command(f"select_workspace {tab}")
-        if not response.startswith("OK"):
-            raise cmuxError(response)
+        _parse_ok(response)
 
     def list_surfaces(self, tab: Union[str, int, None] = None) -> List[Tuple[int, str, bool]]:
         """
@@ -338,25 +687,26 @@ class cmux:
 
         surfaces = []
         for line in response.split("\n"):
-            if not line.strip():
+            # `<*| > <index>: <surface_id>`
+            selected = line[:1] == "*"
+            start = 1 if selected else 0
+            idx_end = line.find(":", start)
+            if idx_end < 0:
                 continue
-            selected = line.startswith("*")
-            parts = line.lstrip("* ").split(" ", 1)
-            if len(parts) >= 2:
-                index = int(parts[0].rstrip(":"))
-                surface_id = parts[1]
-                surfaces.append((index, surface_id, selected))
+            surface_id = line[idx_end + 2:]
+            if not surface_id:
+                continue
+            surfaces.append((int(line[start:idx_end]), surface_id, selected))
         return surfaces
 
     def focus_surface(self, surface: Union[str, int]) -> None:
         """Focus a surface by ID or index in the current tab."""
         response = self._send_command(f"focus_surface {surface}")
-        if not response.startswith("OK"):
-            raise cmuxError(response)
+        _parse_ok(response)
 
     def current_tab(self) -> str:
         """Get the current tab's ID"""
-        response = self._send_command("current_tab")
+        response = self._send_raw(_CMD_CURRENT_TAB)
         if response.startswith("ERROR: Unknown command"):
             response = self._send_command("current_workspace")
         if response.startswith("ERROR"):
@@ -379,19 +729,15 @@ class cmux:
             client.send("echo hello\\n")  # Sends: echo hello<Enter>
             client.send("echo hello" + "\\n")  # Same thing
         """
-        # Escape actual newlines/tabs to their backslash forms for protocol
-        # The server will unescape them
-        escaped = text.replace("\n", "\\n").replace("\r", "\\r").replace("\t", "\\t")
+        escaped = _escape_send_text(text)
         response = self._send_command(f"send {escaped}")
-        if not response.startswith("OK"):
-            raise cmuxError(response)
+        _parse_ok(response)
 
     def send_surface(self, surface: Union[str, int], text: str) -> None:
         """Send text to a specific surface by ID or index in the current tab."""
-        escaped = text.replace("\n", "\\n").replace("\r", "\\r").replace("\t", "\\t")
+        escaped = _escape_send_text(text)
         response = self._send_command(f"send_surface {surface} {escaped}")
-        if not response.startswith("OK"):
-            raise cmuxError(response)
+        _parse_ok(response)
 
     def send_key(self, key: str) -> None:
         """
@@ -403,14 +749,12 @@ class cmux:
             ctrl-<letter> for any letter
         """
         response = self._send_command(f"send_key {key}")
-        if not response.startswith("OK"):
-            raise cmuxError(response)
+        _parse_ok(response)
 
     def send_key_surface(self, surface: Union[str, int], key: str) -> None:
         """Send a special key to a specific surface by ID or index in the current tab."""
         response = self._send_command(f"send_key_surface {surface} {key}")
-        if not response.startswith("OK"):
-            raise cmuxError(response)
+        _parse_ok(response)
 
     def send_line(self, text: str) -> None:
         """Send text followed by Enter"""
@@ -430,23 +774,15 @@ class cmux:
 
     def notify(self, title: str, subtitle: str = "", body: str = "") -> None:
         """Create a notification for the focused surface."""
-        if subtitle or body:
-            payload = f"{title}|{subtitle}|{body}"
-        else:
-            payload = title
-        response = self._send_command(f"notify {payload}")
-        if not response.startswith("OK"):
-            raise cmuxError(response)
+        response = self._send_command(_format_notify("notify", title, subtitle, body))
+        _parse_ok(response)
 
     def notify_surface(self, surface: Union[str, int], title: str, subtitle: str = "", body: str = "") -> None:
         """Create a notification for a specific surface by ID or index."""
-        if subtitle or body:
-            payload = f"{title}|{subtitle}|{body}"
-        else:
-            payload = title
-        response = self._send_command(f"notify_surface {surface} {payload}")
-        if not response.startswith("OK"):
-            raise cmuxError(response)
+        response = self._send_command(
+            _format_notify(f"notify_surface {surface}", title, subtitle, body)
+        )
+        _parse_ok(response)
 
     def list_notifications(self) -> list[dict]:
         """
@@ -458,14 +794,12 @@ class cmux:
             return []
 
         items = []
+        match = _NOTIF_RE.match
         for line in response.split("\n"):
-            if not line.strip():
-                continue
-            _, payload = line.split(":", 1)
-            parts = payload.split("|", 6)
-            if len(parts) < 7:
+            m = match(line)
+            if not m:
                 continue
-            notif_id, tab_id, surface_id, read_text, title, subtitle, body = parts
+            notif_id, tab_id, surface_id, read_text, title, subtitle, body = m.groups()
             items.append({
                 "id": notif_id,
                 "tab_id": tab_id,
@@ -481,8 +815,7 @@ class cmux:
     def clear_notifications(self) -> None:
         """Clear all notifications."""
         response = self._send_command("clear_notifications")
-        if not response.startswith("OK"):
-            raise cmuxError(response)
+        _parse_ok(response)
 
     def set_app_focus(self, active: Union[bool, None]) -> None:
         """Override app focus state. Use None to clear override."""
@@ -491,121 +824,103 @@ class cmux:
         else:
             value = "active" if active else "inactive"
         response = self._send_command(f"set_app_focus {value}")
-        if not response.startswith("OK"):
-            raise cmuxError(response)
+        _parse_ok(response)
 
     def simulate_app_active(self) -> None:
         """Trigger the app active handler."""
         response = self._send_command("simulate_app_active")
-        if not response.startswith("OK"):
-            raise cmuxError(response)
+        _parse_ok(response)
 
     def set_status(self, key: str, value: str, icon: str = None, color: str = None, tab: str = None) -> None:
         """Set a sidebar status entry."""
         # Put options before `--` so value can contain arbitrary tokens like `--tab`.
-        cmd = f"set_status {key}"
+        parts = ["set_status", key]
         if icon:
-            cmd += f" --icon={icon}"
+            parts.append(f"--icon={icon}")
         if color:
-            cmd += f" --color={color}"
-        if tab:
-            cmd += f" --tab={tab}"
-        cmd += f" -- {_quote_option_value(value)}"
-        response = self._send_command(cmd)
-        if not response.startswith("OK"):
-            raise cmuxError(response)
+            parts.append(f"--color={color}")
+        _with_tab(parts, tab)
+        parts.append("--")
+        parts.append(_quote_option_value(value))
+        response = self._send_command(" ".join(parts))
+        _parse_ok(response)
 
     def clear_status(self, key: str, tab: str = None) -> None:
         """Remove a sidebar status entry."""
-        cmd = f"clear_status {key}"
-        if tab:
-            cmd += f" --tab={tab}"
-        response = self._send_command(cmd)
-        if not response.startswith("OK"):
-            raise cmuxError(response)
+        parts = ["clear_status", key]
+        _with_tab(parts, tab)
+        response = self._send_command(" ".join(parts))
+        _parse_ok(response)
 
     def log(self, message: str, level: str = None, source: str = None, tab: str = None) -> None:
         """Append a sidebar log entry."""
         # TerminalController.parseOptions treats any --* token as an option until
         # a `--` separator. Put options first and then use `--` so messages can
         # contain arbitrary tokens like `--force`.
-        cmd = "log"
+        parts = ["log"]
         if level:
-            cmd += f" --level={level}"
+            parts.append(f"--level={level}")
         if source:
-            cmd += f" --source={source}"
-        if tab:
-            cmd += f" --tab={tab}"
-        cmd += f" -- {_quote_option_value(message)}"
-        response = self._send_command(cmd)
-        if not response.startswith("OK"):
-            raise cmuxError(response)
+            parts.append(f"--source={source}")
+        _with_tab(parts, tab)
+        parts.append("--")
+        parts.append(_quote_option_value(message))
+        response = self._send_command(" ".join(parts))
+        _parse_ok(response)
 
     def set_progress(self, value: float, label: str = None, tab: str = None) -> None:
         """Set sidebar progress bar (0.0-1.0)."""
-        cmd = f"set_progress {value}"
+        parts = ["set_progress", str(value)]
         if label:
-            cmd += f" --label={_quote_option_value(label)}"
-        if tab:
-            cmd += f" --tab={tab}"
-        response = self._send_command(cmd)
-        if not response.startswith("OK"):
-            raise cmuxError(response)
+            parts.append(f"--label={_quote_option_value(label)}")
+        _with_tab(parts, tab)
+        response = self._send_command(" ".join(parts))
+        _parse_ok(response)
 
     def clear_progress(self, tab: str = None) -> None:
         """Clear sidebar progress bar."""
-        cmd = "clear_progress"
-        if tab:
-            cmd += f" --tab={tab}"
-        response = self._send_command(cmd)
-        if not response.startswith("OK"):
-            raise cmuxError(response)
+        parts = ["clear_progress"]
+        _with_tab(parts, tab)
+        response = self._send_command(" ".join(parts))
+        _parse_ok(response)
 
     def report_git_branch(self, branch: str, status: str = None, tab: str = None) -> None:
         """Report git branch for sidebar display."""
-        cmd = f"report_git_branch {branch}"
+        parts = ["report_git_branch", branch]
         if status:
-            cmd += f" --status={status}"
-        if tab:
-            cmd += f" --tab={tab}"
-        response = self._send_command(cmd)
-        if not response.startswith("OK"):
-            raise cmuxError(response)
+            parts.append(f"--status={status}")
+        _with_tab(parts, tab)
+        response = self._send_command(" ".join(parts))
+        _parse_ok(response)
 
     def report_ports(self, *ports: int, tab: str = None) -> None:
         """Report listening ports for sidebar display."""
-        port_str = " ".join(str(p) for p in ports)
-        cmd = f"report_ports {port_str}"
-        if tab:
-            cmd += f" --tab={tab}"
-        response = self._send_command(cmd)
-        if not response.startswith("OK"):
-            raise cmuxError(response)
+        parts = ["report_ports"]
+        if ports:
+            parts.extend(map(str, ports))
+        _with_tab(parts, tab)
+        response = self._send_command(" ".join(parts))
+        _parse_ok(response)
 
     def clear_ports(self, tab: str = None) -> None:
         """Clear listening ports for sidebar display."""
-        cmd = "clear_ports"
-        if tab:
-            cmd += f" --tab={tab}"
-        response = self._send_command(cmd)
-        if not response.startswith("OK"):
-            raise cmuxError(response)
+        parts = ["clear_ports"]
+        _with_tab(parts, tab)
+        response = self._send_command(" ".join(parts))
+        _parse_ok(response)
 
     def sidebar_state(self, tab: str = None) -> str:
         """Dump all sidebar metadata for a tab."""
-        cmd = "sidebar_state"
-        if tab:
-            cmd += f" --tab={tab}"
-        return self._send_command(cmd)
+        parts = ["sidebar_state"]
+        _with_tab(parts, tab)
+        return self._send_command(" ".join(parts))
 
     def reset_sidebar(self, tab: str = None) -> None:
         """Clear all sidebar metadata for a tab."""
-        cmd = "reset_sidebar"
-        if tab:
-            cmd += f" --tab={tab}"
-        response = self._send_command(cmd)
-        if not response.startswith("OK"):
-            raise cmuxError(response)
+        parts = ["reset_sidebar"]
+        _with_tab(parts, tab)
+        response = self._send_command(" ".join(parts))
+        _parse_ok(response)
 
     def focus_notification(self, tab: Union[str, int], surface: Union[str, int, None] = None) -> None:
         """Focus tab/surface using the notification flow."""
@@ -614,21 +929,17 @@ class cmux:
         else:
             command = f"focus_notification {tab} {surface}"
         response = self._send_command(command)
-        if not response.startswith("OK"):
-            raise cmuxError(response)
+        _parse_ok(response)
 
     def flash_count(self, surface: Union[str, int]) -> int:
         """Get flash count for a surface by ID or index."""
         response = self._send_command(f"flash_count {surface}")
-        if response.startswith("OK "):
-            return int(response.split(" ", 1)[1])
-        raise cmuxError(response)
+        return int(_parse_ok(response, has_payload=True))
 
     def reset_flash_counts(self) -> None:
         """Reset flash counters."""
-        response = self._send_command("reset_flash_counts")
-        if not response.startswith("OK"):
-            raise cmuxError(response)
+        response = self._send_raw(_CMD_RESET_FLASH)
+        _parse_ok(response)
 
     def read_screen(self) -> str:
         """Read the visible terminal text from the focused surface."""
@@ -643,27 +954,14 @@ class cmux:
         if response in ("No workspaces", "No tabs"):
             return []
 
-        workspaces = []
-        for line in response.split("\n"):
-            if not line.strip():
-                continue
-            selected = line.startswith("*")
-            parts = line.lstrip("* ").split(" ", 2)
-            if len(parts) >= 3:
-                index = int(parts[0].rstrip(":"))
-                workspace_id = parts[1]
-                title = parts[2] if len(parts) > 2 else ""
-                workspaces.append((index, workspace_id, title, selected))
-        return workspaces
+        return _parse_workspace_rows(response)
 
     def new_workspace(self) -> str:
         """Create a new workspace. Returns the new workspace's ID."""
         response = self._send_command("new_workspace")
         if response.startswith("ERROR: Unknown command"):
             return self.new_tab()
-        if response.startswith("OK "):
-            return response[3:]
-        raise cmuxError(response)
+        return _parse_ok(response, has_payload=True)
 
     def close_workspace(self, workspace_id: str) -> None:
         """Close a workspace by ID."""
@@ -671,8 +969,7 @@ class cmux:
         if response.startswith("ERROR: Unknown command"):
             self.close_tab(workspace_id)
             return
-        if not response.startswith("OK"):
-            raise cmuxError(response)
+        _parse_ok(response)
 
     def select_workspace(self, workspace: Union[str, int]) -> None:
         """Select a workspace by ID or index."""
@@ -680,8 +977,7 @@ class cmux:
         if response.startswith("ERROR: Unknown command"):
             self.select_tab(workspace)
             return
-        if not response.startswith("OK"):
-            raise cmuxError(response)
+        _parse_ok(response)
 
     # Pane commands
     def list_panes(self) -> List[Tuple[int, str, int, bool]]:
@@ -709,8 +1005,7 @@ class cmux:
     def focus_pane(self, pane: Union[str, int]) -> None:
         """Focus a pane by ID or index in the current workspace."""
         response = self._send_command(f"focus_pane {pane}")
-        if not response.startswith("OK"):
-            raise cmuxError(response)
+        _parse_ok(response)
 
     def list_pane_surfaces(self, pane: Union[str, int, None] = None) -> List[Tuple[int, str, str, bool]]:
         """
@@ -754,14 +1049,12 @@ class cmux:
     def focus_surface_by_panel(self, surface_id: str) -> None:
         """Focus a surface by its panel ID."""
         response = self._send_command(f"focus_surface_by_panel {surface_id}")
-        if not response.startswith("OK"):
-            raise cmuxError(response)
+        _parse_ok(response)
 
     def focus_webview(self, panel_id: str) -> None:
         """Move keyboard focus into a browser panel's WKWebView."""
         response = self._send_command(f"focus_webview {panel_id}")
-        if not response.startswith("OK"):
-            raise cmuxError(response)
+        _parse_ok(response)
 
     def is_webview_focused(self, panel_id: str) -> bool:
         """Return True if the browser panel's WKWebView is first responder."""
@@ -772,8 +1065,8 @@ class cmux:
 
     def wait_for_webview_focus(self, panel_id: str, timeout_s: float = 2.0) -> None:
         """Poll until the browser panel's WKWebView has focus, or raise."""
-        start = time.time()
-        while time.time() - start < timeout_s:
+        deadline = time.monotonic() + timeout_s
+        while time.monotonic() < deadline:
             if self.is_webview_focused(panel_id):
                 return
             time.sleep(0.05)
@@ -782,14 +1075,12 @@ class cmux:
     def set_shortcut(self, name: str, combo: str) -> None:
         """Set a keyboard shortcut via the debug socket."""
         response = self._send_command(f"set_shortcut {name} {combo}")
-        if not response.startswith("OK"):
-            raise cmuxError(response)
+        _parse_ok(response)
 
     def simulate_shortcut(self, combo: str) -> None:
         """Simulate a keyDown shortcut via the debug socket."""
         response = self._send_command(f"simulate_shortcut {combo}")
-        if not response.startswith("OK"):
-            raise cmuxError(response)
+        _parse_ok(response)
 
     def simulate_type(self, text: str) -> None:
         """Insert text into the current first responder (debug builds only)."""
@@ -801,21 +1092,18 @@ class cmux:
             .replace("\t", "\\t")
         )
         response = self._send_command(f"simulate_type {escaped}")
-        if not response.startswith("OK"):
-            raise cmuxError(response)
+        _parse_ok(response)
 
     def simulate_file_drop(self, surface: Union[str, int], paths: Union[str, List[str]]) -> None:
         """Simulate dropping file path(s) onto a terminal surface (debug builds only)."""
         payload = paths if isinstance(paths, str) else "|".join(paths)
         response = self._send_command(f"simulate_file_drop {surface} {payload}")
-        if not response.startswith("OK"):
-            raise cmuxError(response)
+        _parse_ok(response)
 
     def activate_app(self) -> None:
         """Bring app + main window to front (debug builds only)."""
         response = self._send_command("activate_app")
-        if not response.startswith("OK"):
-            raise cmuxError(response)
+        _parse_ok(response)
 
     def is_terminal_focused(self, panel: Union[str, int]) -> bool:
         """Return True if the terminal panel's Ghostty view is first responder."""
@@ -837,9 +1125,7 @@ class cmux:
     def layout_debug(self) -> dict:
         """Return bonsplit layout snapshot + selected panel bounds."""
         response = self._send_command("layout_debug")
-        if not response.startswith("OK "):
-            raise cmuxError(response)
-        payload = response[3:].strip()
+        payload = _parse_ok(response, has_payload=True).strip()
         try:
             return json.loads(payload)
         except json.JSONDecodeError as e:
@@ -854,9 +1140,7 @@ class cmux:
         if panel is not None:
             cmd += f" {panel}"
         response = self._send_command(cmd)
-        if not response.startswith("OK "):
-            raise cmuxError(response)
-        b64 = response[3:].strip()
+        b64 = _parse_ok(response, has_payload=True).strip()
         raw = base64.b64decode(b64) if b64 else b""
         return raw.decode("utf-8", errors="replace")
 
@@ -866,9 +1150,7 @@ class cmux:
         if panel is not None:
             cmd += f" {panel}"
         response = self._send_command(cmd)
-        if not response.startswith("OK "):
-            raise cmuxError(response)
-        payload = response[3:].strip()
+        payload = _parse_ok(response, has_payload=True).strip()
         try:
             return json.loads(payload)
         except json.JSONDecodeError as e:
@@ -877,8 +1159,7 @@ class cmux:
     def panel_snapshot_reset(self, panel: Union[str, int]) -> None:
         """Reset the stored snapshot for a panel (debug builds only)."""
         response = self._send_command(f"panel_snapshot_reset {panel}")
-        if not response.startswith("OK"):
-            raise cmuxError(response)
+        _parse_ok(response)
 
     def panel_snapshot(self, panel: Union[str, int], label: str = "") -> dict:
         """
@@ -889,9 +1170,7 @@ class cmux:
         if label:
             cmd += f" {label}"
         response = self._send_command(cmd)
-        if not response.startswith("OK "):
-            raise cmuxError(response)
-        payload = response[3:].strip()
+        payload = _parse_ok(response, has_payload=True).strip()
         parts = payload.split(" ", 4)
         if len(parts) != 5:
             raise cmuxError(f"panel_snapshot parse failed: {response}")
@@ -907,28 +1186,22 @@ class cmux:
     def bonsplit_underflow_count(self) -> int:
         """Return bonsplit arranged-subview underflow counter."""
         response = self._send_command("bonsplit_underflow_count")
-        if response.startswith("OK "):
-            return int(response.split(" ", 1)[1])
-        raise cmuxError(response)
+        return int(_parse_ok(response, has_payload=True))
 
     def reset_bonsplit_underflow_count(self) -> None:
         """Reset bonsplit arranged-subview underflow counter."""
         response = self._send_command("reset_bonsplit_underflow_count")
-        if not response.startswith("OK"):
-            raise cmuxError(response)
+        _parse_ok(response)
 
     def empty_panel_count(self) -> int:
         """Return the number of EmptyPanelView appearances."""
         response = self._send_command("empty_panel_count")
-        if response.startswith("OK "):
-            return int(response.split(" ", 1)[1])
-        raise cmuxError(response)
+        return int(_parse_ok(response, has_payload=True))
 
     def reset_empty_panel_count(self) -> None:
         """Reset the EmptyPanelView appearance counter."""
         response = self._send_command("reset_empty_panel_count")
-        if not response.startswith("OK"):
-            raise cmuxError(response)
+        _parse_ok(response)
 
     def new_surface(self, pane: Union[str, int, None] = None,
                     panel_type: str = "terminal", url: str = None) -> str:
@@ -949,9 +1222,7 @@ class cmux:
             cmd += " " + " ".join(args)
 
         response = self._send_command(cmd)
-        if response.startswith("OK "):
-            return response[3:]
-        raise cmuxError(response)
+        return _parse_ok(response, has_payload=True)
 
     def new_pane(self, direction: str = "right", panel_type: str = "terminal",
                  url: str = None) -> str:
@@ -967,9 +1238,7 @@ class cmux:
 
         cmd = "new_pane " + " ".join(args)
         response = self._send_command(cmd)
-        if response.startswith("OK "):
-            return response[3:]
-        raise cmuxError(response)
+        return _parse_ok(response, has_payload=True)
 
     def close_surface(self, surface: Union[str, int, None] = None) -> None:
         """
@@ -980,8 +1249,7 @@ class cmux:
             response = self._send_command("close_surface")
         else:
             response = self._send_command(f"close_surface {surface}")
-        if not response.startswith("OK"):
-            raise cmuxError(response)
+        _parse_ok(response)
 
     def surface_health(self, workspace: Union[str, int, None] = None) -> List[dict]:
         """
@@ -27,12 +27,7 @@ def main() -> int:
 
     base = Path("/tmp") / f"cmux_zdotdir_test_{os.getpid()}"
     try:
-        if base.exists():
-            for child in base.iterdir():
-                try:
-                    child.unlink()
-                except Exception:
-                    pass
+        shutil.rmtree(base, ignore_errors=True)
         base.mkdir(parents=True, exist_ok=True)
 
         orig = base / "orig"
@@ -45,16 +40,17 @@ def main() -> int:
             encoding="utf-8",
         )
 
-        env = dict(os.environ)
-        env["ZDOTDIR"] = str(wrapper_dir)
-        env["CMUX_ZSH_ZDOTDIR"] = str(orig)
-        env["CMUX_ZDOTDIR_TEST_OUTPUT"] = str(seen_path)
-        env["CMUX_SHELL_INTEGRATION"] = "0"
+        env_overrides = {
+            "ZDOTDIR": str(wrapper_dir),
+            "CMUX_ZSH_ZDOTDIR": str(orig),
+            "CMUX_ZDOTDIR_TEST_OUTPUT": str(seen_path),
+            "CMUX_SHELL_INTEGRATION": "0",
+        }
 
         # Non-interactive is enough: .zshenv is always sourced.
         result = subprocess.run(
             ["zsh", "-c", "true"],
-            env=env,
+            env={**os.environ, **env_overrides},
             capture_output=True,
             text=True,
         )